@@ -2,6 +2,7 @@ name = "izzy-heartbeat"
 version = "0.1.4"
 
 from izzy_heartbeat.heartbeat import HeartbeatMessage
+from izzy_heartbeat.heartbeat import HeartbeatQueue
 from izzy_heartbeat.heartbeat import HeartbeatServerThread
 from izzy_heartbeat.heartbeat import HeartbeatListenerThread
 from izzy_heartbeat.heartbeat import HeartbeatResponderThread
@@ -0,0 +1,221 @@
+"""
+_mmsg.py
+=================================
+Batched IPv4 UDP I/O with the Linux ``sendmmsg(2)`` and ``recvmmsg(2)`` system calls.
+"""
+
+import ctypes
+import errno
+import os
+import socket
+import sys
+
+
+class _Iovec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+
+class _Msghdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_Iovec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _Mmsghdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _Msghdr),
+                ('msg_len', ctypes.c_uint)]
+
+
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [('sin_family', ctypes.c_ushort),
+                ('sin_port', ctypes.c_uint16),
+                ('sin_addr', ctypes.c_uint8 * 4),
+                ('sin_zero', ctypes.c_uint8 * 8)]
+
+
+# recvmmsg flag: block until the first datagram arrives, then return whatever else is already queued.
+_MSG_WAITFORONE = 0x10000
+
+
+def _load(name, *argtypes):
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        function = getattr(ctypes.CDLL(None, use_errno=True), name)
+    except (OSError, AttributeError):
+        return None
+    function.argtypes = [ctypes.c_int, ctypes.POINTER(_Mmsghdr), ctypes.c_uint, ctypes.c_int, *argtypes]
+    function.restype = ctypes.c_int
+    return function
+
+
+_libc_sendmmsg = _load('sendmmsg')
+_libc_recvmmsg = _load('recvmmsg', ctypes.c_void_p)
+
+AVAILABLE = _libc_sendmmsg is not None and _libc_recvmmsg is not None
+
+
+def _raise_errno():
+    code = ctypes.get_errno()
+    raise OSError(code, os.strerror(code))
+
+
+class DatagramBatch:
+    """
+    Holds the ``mmsghdr`` array for a fixed list of IPv4 destinations, so that one payload can be sent to all of them
+    in as few system calls as the kernel allows (normally one).
+
+    addresses (list)
+        The (IP address, port) tuples to send to.
+    """
+
+    def __init__(self, addresses):
+        """
+        Builds the destination addresses and message headers once.
+
+        Parameters
+        ----------
+        addresses (list)
+            (IP address, port) tuples. Host names are resolved here, once.
+
+        Raises
+        ------
+        OSError
+            if ``sendmmsg`` is not available or an address cannot be resolved to IPv4.
+        """
+        if not AVAILABLE:
+            raise OSError('sendmmsg is not available on this platform')
+        self.addresses = list(addresses)
+        count = len(self.addresses)
+        self._names = (_SockaddrIn * count)()
+        for name, (host, port) in zip(self._names, self.addresses):
+            name.sin_family = socket.AF_INET
+            name.sin_port = socket.htons(port)
+            name.sin_addr[:] = socket.inet_aton(socket.gethostbyname(host))
+        self._iov = _Iovec()
+        self._messages = (_Mmsghdr * count)()
+        for message, name in zip(self._messages, self._names):
+            message.msg_hdr.msg_name = ctypes.addressof(name)
+            message.msg_hdr.msg_namelen = ctypes.sizeof(_SockaddrIn)
+            message.msg_hdr.msg_iov = ctypes.pointer(self._iov)
+            message.msg_hdr.msg_iovlen = 1
+        self._payload = None
+
+    def send(self, sock, payload):
+        """
+        Sends `payload` to every address in the batch.
+
+        Parameters
+        ----------
+        sock (socket)
+            an IPv4 UDP socket.
+
+        payload (bytes)
+            the datagram to send. Must be ``bytes``; it is referenced in place rather than copied.
+
+        Raises
+        ------
+        OSError
+            if the system call fails.
+        """
+        if payload is not self._payload:
+            self._payload = payload
+            self._iov.iov_base = ctypes.cast(ctypes.c_char_p(payload), ctypes.c_void_p)
+            self._iov.iov_len = len(payload)
+        fd = sock.fileno()
+        count = len(self._messages)
+        sent = 0
+        while sent < count:
+            result = _libc_sendmmsg(fd, ctypes.byref(self._messages[sent]), count - sent, 0)
+            if result < 0:
+                if ctypes.get_errno() != errno.EINTR:
+                    _raise_errno()
+                continue
+            sent += result
+
+
+class ReceiveBatch:
+    """
+    A pool of preallocated receive buffers that are filled by a single ``recvmmsg`` call, so that a burst of
+    datagrams costs one system call instead of one per datagram.
+
+    buffers (list)
+        The receive buffers (``bytearray``), one per datagram slot.
+
+    views (list)
+        A ``memoryview`` of each buffer.
+    """
+
+    def __init__(self, count, size):
+        """
+        Allocates the buffers and message headers once.
+
+        Parameters
+        ----------
+        count (int)
+            the maximum number of datagrams received per call.
+
+        size (int)
+            the size of each buffer, in bytes. Longer datagrams are truncated.
+
+        Raises
+        ------
+        OSError
+            if ``recvmmsg`` is not available on this platform.
+        """
+        if not AVAILABLE:
+            raise OSError('recvmmsg is not available on this platform')
+        self.buffers = [bytearray(size) for _ in range(count)]
+        self.views = [memoryview(buffer) for buffer in self.buffers]
+        self._storage = [(ctypes.c_char * size).from_buffer(buffer) for buffer in self.buffers]
+        self._names = (_SockaddrIn * count)()
+        self._iovs = (_Iovec * count)()
+        self._messages = (_Mmsghdr * count)()
+        for message, iov, name, storage in zip(self._messages, self._iovs, self._names, self._storage):
+            iov.iov_base = ctypes.addressof(storage)
+            iov.iov_len = size
+            message.msg_hdr.msg_name = ctypes.addressof(name)
+            message.msg_hdr.msg_iov = ctypes.pointer(iov)
+            message.msg_hdr.msg_iovlen = 1
+
+    def receive(self, sock):
+        """
+        Blocks until at least one datagram is available on `sock`, then receives as many queued datagrams as there
+        are buffers.
+
+        Parameters
+        ----------
+        sock (socket)
+            a blocking IPv4 UDP socket.
+
+        Returns
+        -------
+        list
+            (length, index, address) tuples, where `index` selects the buffer in ``buffers``/``views`` holding the
+            datagram and `address` is the sender's (IP address, port) tuple. Buffers are overwritten by the next call.
+
+        Raises
+        ------
+        OSError
+            if the system call fails.
+        """
+        name_length = ctypes.sizeof(_SockaddrIn)
+        for message in self._messages:
+            message.msg_hdr.msg_namelen = name_length
+        while True:
+            result = _libc_recvmmsg(sock.fileno(), self._messages, len(self._messages), _MSG_WAITFORONE, None)
+            if result >= 0:
+                break
+            if ctypes.get_errno() != errno.EINTR:
+                _raise_errno()
+        received = []
+        for index in range(result):
+            name = self._names[index]
+            address = (socket.inet_ntoa(bytes(name.sin_addr)), socket.ntohs(name.sin_port))
+            received.append((self._messages[index].msg_len, index, address))
+        return received
@@ -1,8 +1,13 @@
+import queue
+import socket
 import struct
 import threading
 import time
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
 from uuid import UUID
+from izzy_heartbeat import _mmsg
 from izzy_heartbeat.message_type import MessageType
 from izzy_heartbeat.ports import Ports
 from izzy_devices import IZZYStatus
@@ -12,6 +17,92 @@ from logger import setup_logger
 
 logger = setup_logger(__name__, 'heartbeat-log')
 
+# Fixed 46-byte packet header: preamble, msg_id, msg_length, sender_id, receiver_id, message_type.
+_HDR_STRUCT = struct.Struct('<B11sB16s16sB')
+_MSG_LENGTH_OFFSET = 12
+# The length field is a single byte, so no packet can be longer than this.
+_MAX_PACKET_LENGTH = 255
+_RX_BUFFER_SIZE = 1024
+_RX_BATCH_SIZE = 32
+_MSG_ID = b'izzymessage'
+# Every heartbeat packet starts with the preamble followed by the message ID.
+_PACKET_PREFIX = b'\x10' + _MSG_ID
+_NULL_UUID = bytes(16)
+# Scatter-gather sends are not available on every platform (notably Windows).
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+# Enum values used on every packet, resolved once at import.
+_HELLO = MessageType.HELLO.value
+_HERE = MessageType.HERE.value
+_MOTHER_CONNECTED = MotherStatus.CONNECTED.value
+_UDP_TO_CLIENT_PORT = Ports.UDP_TO_CLIENT_PORT.value
+_UDP_FROM_CLIENT_PORT = Ports.UDP_FROM_CLIENT_PORT.value
+
+
+def _payload_length(data):
+    return len(data) if data is not None else 0
+
+
+@lru_cache(maxsize=16)
+def _packet_struct(payload_length):
+    """
+    Returns a compiled ``struct.Struct`` for a complete packet (header plus a payload of `payload_length` bytes).
+    Compiled formats are cached, since only a handful of payload lengths occur in practice.
+    """
+    return struct.Struct(f'{_HDR_STRUCT.format}{payload_length}s')
+
+
+_UNSET = object()
+
+
+def _header_field(name):
+    """
+    Returns a property for a ``HeartbeatMessage`` header field. Assigning a different value to the field discards the
+    message's cached header and packet bytes so that they are re-serialized on next use. Header fields hold
+    immutable values, so re-assigning the same object keeps the caches.
+    """
+    attr = '_' + name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        if getattr(self, attr, _UNSET) is value:
+            return
+        setattr(self, attr, value)
+        self._invalidate()
+
+    return property(getter, setter)
+
+
+def _uuid_field(name):
+    """
+    Returns a property for a ``HeartbeatMessage`` device ID. The ID is stored as its raw 16 bytes, and the ``UUID``
+    object is only built the first time the property is read. Assignments invalidate the caches like
+    ``_header_field``.
+    """
+    attr = '_' + name
+    bytes_attr = attr + '_bytes'
+
+    def getter(self):
+        uuid = getattr(self, attr)
+        if uuid is None:
+            raw = getattr(self, bytes_attr)
+            if raw is not None:
+                uuid = UUID(bytes=raw)
+                setattr(self, attr, uuid)
+        return uuid
+
+    def setter(self, value):
+        # A parsed ID is held as bytes with no UUID yet, so only a non-None UUID identifies an unchanged value.
+        if value is not None and getattr(self, attr, None) is value:
+            return
+        setattr(self, attr, value)
+        setattr(self, bytes_attr, value.bytes if value is not None else None)
+        self._invalidate()
+
+    return property(getter, setter)
+
 
 class HeartbeatMessage:
     """
@@ -22,10 +113,11 @@ class HeartbeatMessage:
 
     msg_id
         11-byte sequence identifying the packet as an IZZY heartbeat packet ('izzymessage'
-        or 0x69, 0x7A, 0x7A, 0x79, 0x6D, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65).
+        or 0x69, 0x7A, 0x7A, 0x79, 0x6D, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65). Shared by all instances as the
+        ``MSG_ID`` class constant; outgoing packets always carry ``MSG_ID``.
 
     msg_length
-        A byte representing the total number of bytes in the packet.
+        A byte representing the total number of bytes in the packet. Read-only; computed from ``data``.
 
     sender_id
         The 64-bit UUID of the sending device.
@@ -33,13 +125,30 @@ class HeartbeatMessage:
     receiver_id
         The 64-bit UUID of the receiving device.
 
+    sender_id_bytes, receiver_id_bytes
+        The raw 16 bytes of ``sender_id`` and ``receiver_id`` (read-only). Parsed packets only store these, and build
+        the ``UUID`` objects on first access.
+
     message_type
         A byte representing the Heartbeat MessageType.
 
     data
         The data payload.
+
+    Serialized packets are cached; the cache is discarded whenever one of the attributes above is reassigned.
     """
 
+    MSG_ID = _MSG_ID
+
+    __slots__ = ('_generation', '_cached_header', '_cached_bytes', '_preamble', '_msg_id', '_sender_id',
+                 '_sender_id_bytes', '_receiver_id', '_receiver_id_bytes', '_message_type', '_data')
+
+    preamble = _header_field('preamble')
+    msg_id = _header_field('msg_id')
+    sender_id = _uuid_field('sender_id')
+    receiver_id = _uuid_field('receiver_id')
+    message_type = _header_field('message_type')
+
     def __init__(self, message_type=None):
         """
         HeartbeatMessage constructor.
@@ -50,81 +159,162 @@ class HeartbeatMessage:
             Takes values of enumerated pre-defined MessageTypes. Defaults to none. In most cases, Mother will
             generate messages of type HELLO (0x01).
         """
+        self._generation = 0
+        self._cached_header = None
+        self._cached_bytes = None
+        self._data = None
         self.preamble = 0x10
-        self.msg_id = [0x69, 0x7A, 0x7A, 0x79, 0x6D, 0x65, 0x73,
-                       0x73, 0x61, 0x67, 0x65]  # 'izzymessage'
-        self.msg_length = 46
+        self.msg_id = self.MSG_ID
         self.sender_id = None
         self.receiver_id = None
         self.message_type = message_type
-        self.data = None
 
     def set_data(self, data):
         """
-        Fills the data payload of the message, and updates the total length of the message by adding the length of
-        the data payload to the base length of the message (46 bytes).
+        Fills the data payload of the message. The total length of the message (``msg_length``) follows from the
+        length of the payload. The serialized packet is cached, so changes made to a payload in place (for example,
+        editing a ``bytearray``) only take effect once the payload is passed to ``set_data`` again.
 
         Parameters
         ----------
         data
-            A bytearray of data.
+            A bytearray of data, or None for no payload. Any other iterable of byte values (such as a list of ints
+            or a ``memoryview``) is copied into ``bytes``.
         """
         self.data = data
-        if self.data is not None:
-            self.msg_length = 46 + len(self.data)
+
+    @property
+    def data(self):
+        """
+        The data payload. Assigning a payload discards the cached packet bytes, and the cached header too if the
+        payload length (and so ``msg_length``) changes. In-place changes to the payload are not detected; reassign
+        it (or call ``set_data``) afterwards.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        if value is not None and not isinstance(value, (bytes, bytearray)):
+            value = bytes(value)
+        self._data = value
+        # The cached header stays; get_header checks its length byte against msg_length before reusing it.
+        self._invalidate(header=False)
+
+    def _invalidate(self, header=True):
+        """
+        Discards the cached packet bytes (and, if `header` is True, the cached header) after a field has changed.
+        Bumping the generation counter stops a serialization that was already in progress on another thread from
+        storing a result built from the old values.
+        """
+        self._generation += 1
+        if header:
+            self._cached_header = None
+        self._cached_bytes = None
+
+    @property
+    def sender_id_bytes(self):
+        """
+        The raw 16 bytes of the sender's UUID, or None if it is not set.
+        """
+        return self._sender_id_bytes
+
+    @property
+    def receiver_id_bytes(self):
+        """
+        The raw 16 bytes of the receiver's UUID, or None if it is not set.
+        """
+        return self._receiver_id_bytes
+
+    @property
+    def msg_length(self):
+        """
+        The total number of bytes in the packet: the base length of the message (46 bytes) plus the length of the
+        data payload. Always derived from ``data``, so it cannot disagree with the payload.
+        """
+        return _HDR_STRUCT.size + _payload_length(self.data)
+
+    def get_header(self):
+        """
+        Returns
+        -------
+        bytes
+            the 46 header bytes of the packet, without the data payload. The result is cached until a header field
+            or the payload length changes, so it can be sent alongside a separately held payload.
+        """
+        header = self._cached_header
+        if header is None or header[_MSG_LENGTH_OFFSET] != self.msg_length:
+            generation = self._generation
+            header = _HDR_STRUCT.pack(*self._header_fields())
+            if self._generation == generation:
+                self._cached_header = header
+        return header
 
     def get_message(self):
         """
         Returns
         -------
-        bytearray
-            a bytearray containing the sequence of bytes in the packet.
+        bytes
+            the sequence of bytes in the packet. The result is cached until the message is modified.
 
         """
-        message = bytearray()
-        message.append(self.preamble)
+        message = self._cached_bytes
+        if message is not None:
+            return message
 
-        if self.msg_id is not None:
-            for byte in self.msg_id:
-                message.append(byte)
-        else:
-            for i in range(0, 11):
-                message.append(0x00)
+        generation = self._generation
+        data = self.data if self.data is not None else b''
+        message = _packet_struct(len(data)).pack(*self._header_fields(), data)
+        if self._generation == generation:
+            self._cached_bytes = message
 
-        message.append(self.msg_length)
+        return message
 
-        if self.sender_id is not None:
-            for byte in self.sender_id.bytes:
-                message.append(byte)
-        else:
-            for i in range(0, 16):
-                message.append(0x00)
+    def pack_into(self, buffer, offset=0):
+        """
+        Writes the packet into a preallocated, writable buffer (such as a ``bytearray``) instead of allocating a new
+        one for every packet.
 
-        if self.receiver_id is not None:
-            for byte in self.receiver_id.bytes:
-                message.append(byte)
-        else:
-            for i in range(0, 16):
-                message.append(0x00)
+        Parameters
+        ----------
+        buffer
+            a writable buffer with room for at least `msg_length` bytes after `offset`.
 
-        message.append(self.message_type)
+        offset
+            the position in `buffer` at which to start writing. Defaults to 0.
 
-        if self.data is not None:
-            for byte in self.data:
-                message.append(byte)
+        Returns
+        -------
+        int
+            the number of bytes written.
+        """
+        data = self.data if self.data is not None else b''
+        packet_struct = _packet_struct(len(data))
+        packet_struct.pack_into(buffer, offset, *self._header_fields(), data)
+        return packet_struct.size
 
-        return message
+    def _header_fields(self):
+        """
+        Returns the header fields in packet order, substituting zero bytes for any unset identifiers.
+        """
+        return (self.preamble,
+                self.MSG_ID,
+                self.msg_length,
+                self._sender_id_bytes if self._sender_id_bytes is not None else _NULL_UUID,
+                self._receiver_id_bytes if self._receiver_id_bytes is not None else _NULL_UUID,
+                self.message_type)
 
     def process_packet(self, raw_data):
         """
-        Takes a packet of received data (as a bytearray) and unpacks it, filling the attributes of the instance of
-        HeartbeatMessage with the appropriate bytes provided the length of the packet matches the length byte sent
+        Takes a packet of received data (as a bytes-like object) and unpacks it, filling the attributes of the instance
+        of HeartbeatMessage with the appropriate bytes provided the length of the packet matches the length byte sent
         in the packet.
 
         Parameters
         ----------
         raw_data
-            a bytearray containing a raw packet
+            a bytes-like object (``bytes``, ``bytearray`` or ``memoryview``) containing a raw packet. It is read
+            through a ``memoryview`` without being copied as a whole; only the header fields and the payload are
+            copied out, so the caller may reuse its buffer afterwards.
 
         Returns
         -------
@@ -133,16 +323,19 @@ class HeartbeatMessage:
             instance; otherwise False.
         """
 
-        data = bytes(raw_data)
-        self.preamble = data[0]
-        self.msg_id = bytes(data[1:12])
-        if len(raw_data) == data[12]:
-            self.msg_length = data[12]
-            self.sender_id = UUID(bytes=data[13:29])
-            self.receiver_id = UUID(bytes=data[29:45])
-            self.message_type = data[45]
-            if len(data) > 46:
-                self.data = data[46:len(data)]
+        view = memoryview(raw_data)
+        if len(view) < _HDR_STRUCT.size:
+            return False
+        preamble, msg_id, msg_length, sender_id, receiver_id, message_type = _HDR_STRUCT.unpack_from(view)
+        self.preamble = preamble
+        self.msg_id = msg_id
+        if len(view) == msg_length:
+            self._sender_id, self._sender_id_bytes = None, sender_id
+            self._receiver_id, self._receiver_id_bytes = None, receiver_id
+            self._invalidate()
+            self.message_type = message_type
+            if msg_length > _HDR_STRUCT.size:
+                self.data = view[_HDR_STRUCT.size:msg_length].tobytes()
             else:
                 self.data = None
             return True
@@ -150,6 +343,90 @@ class HeartbeatMessage:
             return False
 
 
+class HeartbeatQueue:
+    """
+    A lightweight hand-off queue between a ``HeartbeatListenerThread`` and a ``HeartbeatResponderThread``. It
+    supports the subset of the ``queue.Queue`` interface those threads use and can be passed to them in its place.
+
+    Items are held in a ``collections.deque``, whose ``append`` and ``popleft`` are atomic, so ``put`` and a ``get``
+    that finds an item waiting take no locks. A ``threading.Event`` is only used to wake a consumer that is waiting
+    on an empty queue. The queue is unbounded, and ``task_done``/``join`` are not supported.
+    """
+
+    def __init__(self):
+        """
+        Creates an empty queue.
+        """
+        self._items = deque()
+        self._ready = threading.Event()
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Appends `item` to the queue and wakes a waiting consumer. Never blocks; `block` and `timeout` are accepted for
+        compatibility with ``queue.Queue``.
+        """
+        self._items.append(item)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put_nowait(self, item):
+        """
+        Equivalent to ``put(item)``.
+        """
+        self.put(item)
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns the oldest item in the queue.
+
+        Parameters
+        ----------
+        block (boolean)
+            whether to wait for an item if the queue is empty.
+
+        timeout (float)
+            the maximum time to wait, in seconds, or None to wait indefinitely.
+
+        Raises
+        ------
+        queue.Empty
+            if no item is available (immediately when `block` is False, or once `timeout` expires).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            if not block:
+                raise queue.Empty
+            self._ready.clear()
+            if self._items:
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            self._ready.wait(remaining)
+
+    def get_nowait(self):
+        """
+        Equivalent to ``get(block=False)``.
+        """
+        return self.get(block=False)
+
+    def qsize(self):
+        """
+        Returns the number of items in the queue.
+        """
+        return len(self._items)
+
+    def empty(self):
+        """
+        Returns True if the queue is empty.
+        """
+        return not self._items
+
+
 class HeartbeatServerThread(threading.Thread):
     """Creates a separate worker thread for sending ``HeartbeatMessage`` packets.
 
@@ -162,12 +439,16 @@ class HeartbeatServerThread(threading.Thread):
     interval (int)
         The delay between packet pulses (in seconds).
 
+    targets (list)
+        The (IP address, port) tuples each pulse is sent to. Assigning a new list takes effect from the next pulse;
+        changes made to the list in place are not picked up.
+
     _running (boolean)
         A boolean to control stopping the thread, if necessary.
 
     """
 
-    def __init__(self, send_socket, message, interval=1):
+    def __init__(self, send_socket, message, interval=1, targets=None):
         """
         Default constructor. Extends ``threading.Thread``.
 
@@ -181,24 +462,52 @@ class HeartbeatServerThread(threading.Thread):
 
         interval (int)
             time interval between sending packets, in seconds
+
+        targets (list)
+            (IP address, port) tuples to send each pulse to. Defaults to broadcasting on ``UDP_TO_CLIENT_PORT``.
         """
         super().__init__(daemon=True)
         self.send_socket = send_socket
         self.message = message
         self.interval = interval
+        self.targets = targets if targets is not None else [('255.255.255.255', _UDP_TO_CLIENT_PORT)]
         self._running = True
 
     def run(self):
         """
         Starts the ``HeartbeatThread``, which will run as long as the `_running` flag is True. Sends the message and
-        after waiting the specified interval, in a loop.
+        after waiting the specified interval, in a loop. The message is only re-serialized after it has been modified.
+        On Linux, a pulse to several IPv4 targets is sent with a single ``sendmmsg`` call; otherwise each target is
+        sent to in turn.
         """
+        current_targets = None
         while self._running:
-            self.send_socket.sendto(self.message.get_message(),
-                                    ('255.255.255.255', Ports.UDP_TO_CLIENT_PORT.value))
+            if self.targets is not current_targets:
+                current_targets = self.targets
+                targets = list(current_targets)
+                batch = self._make_batch(targets)
+            packet = self.message.get_message()
+            if batch is not None:
+                batch.send(self.send_socket, packet)
+            else:
+                for address in targets:
+                    self.send_socket.sendto(packet, address)
             logger.info("(%s) (server) - Heartbeat pulse sent.", format(__name__))
             time.sleep(self.interval)
 
+    def _make_batch(self, targets):
+        """
+        Returns a ``DatagramBatch`` for `targets` if batching is worthwhile and supported, otherwise None.
+        """
+        if len(targets) < 2 or not _mmsg.AVAILABLE or self.send_socket.family != socket.AF_INET:
+            return None
+        try:
+            return _mmsg.DatagramBatch(targets)
+        except OSError:
+            logger.warning("(%s) (server) - Could not batch heartbeat targets; sending individually.",
+                           format(__name__))
+            return None
+
     def stop(self):
         """
         Sets the `_running` flag to False.
@@ -223,10 +532,7 @@ class HeartbeatListenerThread(threading.Thread):
         A boolean to control stopping the thread, if necessary.
 
     hb_messages (Queue)
-        A ``Queue`` for placing received messages.
-
-    message (HeartbeatMessage)
-        A ``HeartbeatMessage`` instance for packaging received packets as a message.
+        A ``Queue`` (or ``HeartbeatQueue``) for placing received messages.
     """
     def __init__(self, rcv_socket, messages, signal):
         """
@@ -238,7 +544,7 @@ class HeartbeatListenerThread(threading.Thread):
             UDP socket for receiving Heartbeat response packets.
 
         messages (Queue)
-            A ``Queue`` for placing received messages.
+            A ``Queue`` (or ``HeartbeatQueue``) for placing received messages.
 
         signal (Signal)
             A ``signalslot`` ``Signal`` for triggering other actions when a message is received.
@@ -247,27 +553,56 @@ class HeartbeatListenerThread(threading.Thread):
         self.rcv_socket = rcv_socket
         self._running = True
         self.hb_messages = messages
-        self.message = HeartbeatMessage()
         self.signal = signal
+        self._rx_buffer = bytearray(_RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
 
     def run(self):
         """
         Starts the ``HeartbeatListenerThread``, which will run as long as the `_running` flag is True. Receives UDP
         packets, extracts the IP address and port of the sender, and creates a new ``HeartbeatMessage`` populated
         from the packet. Then it places a tuple containing the length of the packet, the address of the sender (as a
-        tuple with the IP address and the port number), and the packet itself on the message queue.
+        tuple with the IP address and the port number), and the packet itself on the message queue. Datagrams that
+        are too short or do not start with the heartbeat preamble and message ID are discarded before any parsing.
+        On Linux, all datagrams already waiting on a blocking IPv4 socket are received with a single ``recvmmsg``
+        call into a pool of preallocated buffers.
         """
+        batch = self._make_batch()
         while self._running:
-            data, address = self.rcv_socket.recvfrom(1024)
-            logger.info(f"(%s) (listener)- Heartbeat received", format(__name__))
-            self.message.process_packet(data)
-            # logger.debug(f"(%s) (listener) - Data length: {len(data)}; from {address}: {self.message}.",
-                         # format(__name__))
-            self.hb_messages.put((len(data), self.message,
-                                 address))
-            # logger.debug(f"(%s) (listener) - Queue length: {self.hb_messages.qsize()}.", format(__name__))
-            if self.signal is not None:
-                self.signal.emit()
+            if batch is not None:
+                for length, index, address in batch.receive(self.rcv_socket):
+                    self._handle_packet(batch.buffers[index], batch.views[index], length, address)
+            else:
+                length, address = self.rcv_socket.recvfrom_into(self._rx_buffer)
+                self._handle_packet(self._rx_buffer, self._rx_view, length, address)
+
+    def _make_batch(self):
+        """
+        Returns an ``_mmsg.ReceiveBatch`` if batched receives are supported for the socket, otherwise None.
+        ``recvmmsg`` ignores socket timeouts, so sockets with a timeout use ``recvfrom_into`` instead.
+        """
+        if (not _mmsg.AVAILABLE or self.rcv_socket.family != socket.AF_INET or
+                self.rcv_socket.gettimeout() is not None):
+            return None
+        return _mmsg.ReceiveBatch(_RX_BATCH_SIZE, _RX_BUFFER_SIZE)
+
+    def _handle_packet(self, buffer, view, length, address):
+        """
+        Parses a received datagram into a new ``HeartbeatMessage`` and places it on the message queue, unless it is
+        not a heartbeat packet.
+        """
+        if length < _HDR_STRUCT.size or not buffer.startswith(_PACKET_PREFIX):
+            return
+        logger.info(f"(%s) (listener)- Heartbeat received", format(__name__))
+        message = HeartbeatMessage()
+        message.process_packet(view[:length])
+        # logger.debug(f"(%s) (listener) - Data length: {length}; from {address}: {message}.",
+                     # format(__name__))
+        self.hb_messages.put((length, message,
+                             address))
+        # logger.debug(f"(%s) (listener) - Queue length: {self.hb_messages.qsize()}.", format(__name__))
+        if self.signal is not None:
+            self.signal.emit()
 
     def stop(self):
         """
@@ -282,52 +617,69 @@ class HeartbeatResponderThread(threading.Thread):
         self.send_socket = send_socket
         self._running = True
         self.hb_messages = hb_messages
-        self.received_message = HeartbeatMessage()
         self.reply_message = HeartbeatMessage()
         self.mother = mother
         self.izzy = izzy
+        # Payload builders for statuses that need more than the base response, keyed by status value.
+        self._response_builders = {
+            IZZYStatus.FOLLOWING.value: izzy.build_following_response,
+        }
+        self._tx_buffer = bytearray(_MAX_PACKET_LENGTH)
+        self._tx_view = memoryview(self._tx_buffer)
+
+    def _next_message(self):
+        """
+        Blocks until a message is available on the queue, then drains any backlog that built up in the meantime so
+        that a burst of queued pulses is answered with a single reply to the most recent HELLO.
+
+        Returns
+        -------
+        tuple
+            the (length, message, address) entry to respond to.
+        """
+        entry = self.hb_messages.get()
+        while True:
+            try:
+                pending = self.hb_messages.get_nowait()
+            except queue.Empty:
+                return entry
+            if pending[1].message_type == _HELLO:
+                entry = pending
 
     def run(self):
         while self._running:
-            data = bytearray()
-            length, self.received_message, address = self.hb_messages.get()
-            # logger.debug(f"(%s) (responder) - Preamble: {self.received_message.preamble}.", format(__name__))
-            if self.received_message.preamble == int(0x10):
-                if list(self.received_message.msg_id) == [0x69, 0x7A, 0x7A, 0x79, 0x6D, 0x65,
-                                                          0x73, 0x73, 0x61, 0x67, 0x65]:
-                    if self.received_message.message_type == MessageType.HELLO.value:
+            length, received_message, address = self._next_message()
+            # logger.debug(f"(%s) (responder) - Preamble: {received_message.preamble}.", format(__name__))
+            if received_message.preamble == 0x10:
+                if received_message.msg_id == _MSG_ID:
+                    if received_message.message_type == _HELLO:
                         # logger.debug(f"(%s) (responder) - Message is a heartbeat pulse.", format(__name__))
-                        if (self.mother.uuid is None or self.mother.uuid !=
-                                self.received_message.sender_id):
-                            self.mother.uuid = self.received_message.sender_id
+                        if (self.mother.uuid is None or self.mother.uuid.bytes !=
+                                received_message.sender_id_bytes):
+                            self.mother.uuid = received_message.sender_id
                             self.mother.ip_address = address[0]
-                            self.mother.status = MotherStatus.CONNECTED.value
+                            self.mother.status = _MOTHER_CONNECTED
                             # logger.debug("(%s) (responder) - First pulse received. Initializing Mother.",
                             # format(__name__))
                         self.reply_message.sender_id = self.izzy.uuid
                         self.reply_message.receiver_id = self.mother.uuid
                         self.izzy.last_contact = datetime.now()
-                        data.extend(self.izzy.build_base_response())
-                        # logger.debug(f"(%s) (responder) - base payload: {data}", format(__name__))
-                        self.reply_message.message_type = MessageType.HERE.value
-                        match self.izzy.status:
-                            case IZZYStatus.AVAILABLE.value:
-                                pass
-                            case IZZYStatus.MOVING.value:
-                                pass
-                            case IZZYStatus.FOLLOWING.value:
-                                data = self.izzy.build_following_response()
-                            case IZZYStatus.ESTOP.value:
-                                pass
-                            case _:
-                                pass
+                        self.reply_message.message_type = _HERE
+                        build_response = self._response_builders.get(self.izzy.status,
+                                                                     self.izzy.build_base_response)
+                        data = build_response()
                         self.reply_message.set_data(data)
                         # logger.debug(f"(%s) (responder) - follower payload: {data}", format(__name__))
                         # logger.debug(f"(%s) (responder) - message length: {self.reply_message.msg_length}",
                         #             format(__name__))
-                        time.sleep(0.1)
-                        self.send_socket.sendto(self.reply_message.get_message(),
-                                                (self.mother.ip_address, Ports.UDP_FROM_CLIENT_PORT.value))
+                        reply_address = (self.mother.ip_address, _UDP_FROM_CLIENT_PORT)
+                        if _HAS_SENDMSG:
+                            payload = self.reply_message.data
+                            self.send_socket.sendmsg([self.reply_message.get_header(),
+                                                      payload if payload is not None else b''], (), 0, reply_address)
+                        else:
+                            packet_length = self.reply_message.pack_into(self._tx_buffer)
+                            self.send_socket.sendto(self._tx_view[:packet_length], reply_address)
                         # logger.debug(f"(%s) (responder) - Reply sent: {self.reply_message.get_message()}",
                         #             format(__name__))
                     else:
@@ -336,3 +688,10 @@ class HeartbeatResponderThread(threading.Thread):
                     pass
             else:
                 pass
+
+    def stop(self):
+        """
+        Sets the `_running` flag to False. The send socket belongs to the caller and is left open, so it can be shared
+        with other threads and reused after the responder stops.
+        """
+        self._running = False